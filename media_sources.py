@@ -1,17 +1,160 @@
 import re
 import asyncio
 import argparse
+import functools
+from collections import deque
 from datetime import datetime, timedelta, date
 from urllib.parse import urlparse, urljoin
+from dataclasses import dataclass
 from typing import List, Dict, Optional
 import html as ihtml
-import requests
-import xml.etree.ElementTree as ET
-import gzip
+import aiohttp
+from lxml import etree as ET
+
+try:
+    # ISA-L 的 SIMD inflate，接口与 zlib 一致
+    from isal import isal_zlib as zlib
+except ImportError:
+    import zlib
 
 from crawl4ai import AsyncWebCrawler, BrowserConfig, CrawlerRunConfig, CacheMode
 
 
+# 预编译正则：避免热路径上反复查 re 模块缓存
+_RE_WS = re.compile(r"\s+")
+_RE_ABS_URL = re.compile(r"https?://[^\"'\s<>]+")
+_RE_SCHEME = re.compile(r"^https?://")
+_RE_EMBED = re.compile(r"^https?://[^/]+/(https?://.+)$")
+_RE_DATE_CN = re.compile(r"(20\d{2})[-/年](\d{1,2})[-/月](\d{1,2})")
+_RE_DATE_URL = re.compile(r"(20\d{2})[/-](\d{1,2})[/-](\d{1,2})")
+# 中文日期分隔符 -> "-"
+_DT_TRANS = str.maketrans({"年": "-", "月": "-", "日": None, "/": "-"})
+# 归一化后的日期："YYYY-MM-DD"、"YYYY-MM-DD HH:MM"、"YYYY-MM-DD HH:MM:SS"
+# 各字段照搬 strptime 的 %Y/%m/%d/%H/%M/%S 写法，接受的输入与原先三次 strptime 一致
+_RE_DT = re.compile(
+    r"(\d\d\d\d)-(1[0-2]|0[1-9]|[1-9])-(3[0-1]|[1-2]\d|0[1-9]|[1-9]| [1-9])"
+    r"(?: (2[0-3]|[0-1]\d|\d):([0-5]\d|\d)(?::(6[0-1]|[0-5]\d|\d))?)?"
+)
+_RE_META_DATE = re.compile(r'content="([^"]*202\d[-/]\d{1,2}[-/]\d{1,2}[^"]*)"')
+
+# 入口页：滚动到底部触发懒加载
+_JS_SCROLL = """
+    window.scrollTo(0, document.body.scrollHeight);
+    await new Promise(r => setTimeout(r, 1200));
+    window.scrollTo(0, document.body.scrollHeight);
+"""
+
+# 非文章链接特征（标签/栏目/作者页、活动页等）
+_URL_BLACKLIST = (
+    "/tag/", "/tags/", "/category/", "/author/", "javascript:", "#",
+    "/meet/", "ai_shortlist", "/short_urls/",
+)
+
+# robots / sitemap 抓取
+_HTTP_TIMEOUT = aiohttp.ClientTimeout(total=12)
+_PROBE_TIMEOUT = aiohttp.ClientTimeout(total=5)
+_SITEMAP_CONCURRENCY = 8
+_SITEMAP_CHUNK_SIZE = 64 * 1024
+
+# 单个来源同时抓取的文章详情页数量
+_ARTICLE_CONCURRENCY = 6
+
+# 各站点文章 URL：绝对路径与相对路径合并为一个交替式，源码只扫一遍
+# group(1) 命中绝对 URL，group(2) 命中相对路径
+_HTML_URL_PATTERNS = {
+    "qbitai": re.compile(
+        r'(https?://(?:www\.)?qbitai\.com/20\d{2}/\d{2}/\d+\.html)'
+        r'|(/20\d{2}/\d{2}/\d+\.html)'
+    ),
+    # aiera 常见路径：/2026/02/23/...
+    "xinzhiyuan": re.compile(
+        r'(https?://(?:www\.)?aiera\.com\.cn/20\d{2}/\d{2}/\d{2}/[^"\'<>\s]+)'
+        r'|(/20\d{2}/\d{2}/\d{2}/[^"\'<>\s]+)'
+    ),
+    # 机器之心文章路径
+    "jiqizhixin": re.compile(
+        r'(https?://(?:www\.)?jiqizhixin\.com/articles/[^"\'<>\s]+)'
+        r'|(/articles/[^"\'<>\s]+)'
+    ),
+}
+
+
+# URL / 日期解析均为纯函数，同一链接会在提取、过滤、排序中反复出现，结果做缓存
+@functools.lru_cache(maxsize=4096)
+def _to_datetime_cached(s: str) -> Optional[datetime]:
+    if not s:
+        return None
+    # 常见情况：_extract_date_from_text_or_url 产出的 "YYYY-MM-DD"，直接用 C 实现的 fromisoformat
+    if len(s) == 10 and s[4] == "-" and s[7] == "-":
+        try:
+            return datetime.fromisoformat(s)
+        except ValueError:
+            pass
+    s = s.translate(_DT_TRANS)
+    s = _RE_WS.sub(" ", s)
+    m = _RE_DT.fullmatch(s[:19])
+    if not m:
+        return None
+    y, mo, d, hh, mi, ss = m.groups()
+    try:
+        return datetime(int(y), int(mo), int(d), int(hh or 0), int(mi or 0), int(ss or 0))
+    except ValueError:
+        return None
+
+
+@functools.lru_cache(maxsize=4096)
+def _normalize_url_cached(base: str, url: str) -> str:
+    if not url:
+        return ""
+
+    u = url.strip().replace("\\/", "/")
+
+    # 关键修复：若包含多个绝对 URL，取最后一个真实目标
+    abs_urls = _RE_ABS_URL.findall(u)
+    if len(abs_urls) >= 2:
+        u = abs_urls[-1]
+    elif len(abs_urls) == 1 and not u.startswith(abs_urls[0]):
+        # 例如 "xxx https://a.com/1"
+        u = abs_urls[0]
+
+    # 相对路径补全
+    if not _RE_SCHEME.match(u):
+        u = urljoin(base, u)
+    m = _RE_EMBED.match(u)
+    if m:
+        u = m.group(1)
+
+    return u.split("#")[0].strip()
+
+
+@functools.lru_cache(maxsize=4096)
+def _is_article_url_cached(url: str) -> bool:
+    u = url.lower().strip()
+    pu = urlparse(u)
+
+    if pu.path in ("", "/"): return False
+    if pu.query and "author=" in pu.query: return False
+    if any(x in u for x in _URL_BLACKLIST): return False
+
+    if u.endswith(".html"): return True
+    if "/articles/" in u and len(u.split("/articles/")[-1]) > 3: return True
+
+    p = pu.path
+    if "//" in p:  # 含空段时按非空段计数
+        return len([x for x in p.split("/") if x]) >= 3
+    depth = p.count("/") + 1 - p.startswith("/") - p.endswith("/")
+    return depth >= 3
+
+
+@dataclass(slots=True)
+class Candidate:
+    """待抓取详情页的候选文章；仅在结果输出时才转成 dict"""
+    title: str
+    url: str
+    date: str = ""                  # 从 URL 中解析出的日期
+    dt: Optional[datetime] = None
+
+
 class MediaSourceCrawl4AI:
     def __init__(self, headless: bool = True, debug: bool = False):
         self.headless = headless
@@ -22,20 +165,10 @@ class MediaSourceCrawl4AI:
             print(msg)
 
     def _clean(self, s: str) -> str:
-        return re.sub(r"\s+", " ", (s or "")).strip()
+        return _RE_WS.sub(" ", (s or "")).strip()
 
     def _to_datetime(self, s: str) -> Optional[datetime]:
-        s = (s or "").strip()
-        if not s:
-            return None
-        s = s.replace("年", "-").replace("月", "-").replace("日", "").replace("/", "-")
-        s = re.sub(r"\s+", " ", s)
-        for fmt in ("%Y-%m-%d", "%Y-%m-%d %H:%M", "%Y-%m-%d %H:%M:%S"):
-            try:
-                return datetime.strptime(s[:19], fmt)
-            except Exception:
-                pass
-        return None
+        return _to_datetime_cached((s or "").strip())
 
     def _is_recent(self, dt: Optional[datetime], days: int) -> bool:
         if days <= 0:
@@ -45,170 +178,170 @@ class MediaSourceCrawl4AI:
         return dt >= (datetime.now() - timedelta(days=days))
 
     def _normalize_url(self, base: str, url: str) -> str:
-        if not url:
-            return ""
-
-        u = url.strip().replace("\\/", "/")
-
-        # 关键修复：若包含多个绝对 URL，取最后一个真实目标
-        abs_urls = re.findall(r"https?://[^\"'\s<>]+", u)
-        if len(abs_urls) >= 2:
-            u = abs_urls[-1]
-        elif len(abs_urls) == 1 and not u.startswith(abs_urls[0]):
-            # 例如 "xxx https://a.com/1"
-            u = abs_urls[0]
-
-        # 相对路径补全
-        if not re.match(r"^https?://", u):
-            u = urljoin(base, u)
-        m = re.match(r"^https?://[^/]+/(https?://.+)$", u)
-        if m:
-            u = m.group(1)
-
-        return u.split("#")[0].strip()
+        # 常见情况：已是单个干净的绝对 URL，无需走正则
+        if url and url.startswith(("http://", "https://")) and "\\/" not in url and url.find("://", 6) == -1:
+            return url.split("#", 1)[0].strip()
+        return _normalize_url_cached(base, url)
 
     def _is_article_url(self, url: str) -> bool:
-        u = url.lower().strip()
-        pu = urlparse(u)
-
-        if pu.path in ("", "/"): return False
-        if pu.query and "author=" in pu.query: return False
-        if any(x in u for x in ["/tag/", "/tags/", "/category/", "/author/", "javascript:", "#"]): return False
-        if any(x in u for x in ["/meet/", "ai_shortlist", "/short_urls/"]): return False
-
-        if re.search(r"/20\d{2}/\d{1,2}/\d+\.html$", u): return True
-        if u.endswith(".html"): return True
-        if "/articles/" in u and len(u.split("/articles/")[-1]) > 3: return True
-
-        depth = len([x for x in pu.path.split("/") if x])
-        return depth >= 3
+        return _is_article_url_cached(url)
 
     def _extract_date_from_text_or_url(self, text: str, url: str) -> str:
-        m = re.search(r"(20\d{2})[-/年](\d{1,2})[-/月](\d{1,2})", text or "")
-        if m:
-            return f"{m.group(1)}-{int(m.group(2)):02d}-{int(m.group(3)):02d}"
-        m2 = re.search(r"(20\d{2})[/-](\d{1,2})[/-](\d{1,2})", url or "")
-        if m2:
-            return f"{m2.group(1)}-{int(m2.group(2)):02d}-{int(m2.group(3)):02d}"
-        return ""
+        m = _RE_DATE_CN.search(text or "") or _RE_DATE_URL.search(url or "")
+        if not m:
+            return ""
+        y, mo, d = m.groups()
+        return f"{y}-{int(mo):02d}-{int(d):02d}"
 
-    def _extract_urls_from_html(self, source: str, entry: str, raw_html: str) -> List[Dict]:
+    def _extract_urls_from_html(self, source: str, entry: str, raw_html: str) -> List[Candidate]:
         """当 crawl4ai links 为空时，从源码兜底提取文章 URL"""
         if not raw_html:
             return []
         h = ihtml.unescape(raw_html).replace("\\/", "/")
         urls = set()
 
-        if source == "qbitai":
-            for u in re.findall(r'https?://(?:www\.)?qbitai\.com/20\d{2}/\d{2}/\d+\.html', h):
-                urls.add(u)
-            for p in re.findall(r'(/20\d{2}/\d{2}/\d+\.html)', h):
-                urls.add(urljoin(entry, p))
-
-        elif source == "xinzhiyuan":
-            # aiera 常见路径：/2026/02/23/...
-            for u in re.findall(r'https?://(?:www\.)?aiera\.com\.cn/20\d{2}/\d{2}/\d{2}/[^"\'<>\s]+', h):
-                urls.add(u)
-            for p in re.findall(r'(/20\d{2}/\d{2}/\d{2}/[^"\'<>\s]+)', h):
-                urls.add(urljoin(entry, p))
-
-        elif source == "jiqizhixin":
-            # 机器之心文章路径
-            for u in re.findall(r'https?://(?:www\.)?jiqizhixin\.com/articles/[^"\'<>\s]+', h):
-                urls.add(u)
-            for p in re.findall(r'(/articles/[^"\'<>\s]+)', h):
-                urls.add(urljoin(entry, p))
-
-        out = [{"title": "待解析标题", "url": u} for u in urls if self._is_article_url(u)]
+        pattern = _HTML_URL_PATTERNS.get(source)
+        if pattern:
+            for u, p in pattern.findall(h):
+                urls.add(u or urljoin(entry, p))
+
+        out = [Candidate("待解析标题", u) for u in urls if self._is_article_url(u)]
         return out
 
-    def _get_sitemap_urls_from_robots(self, base: str) -> List[str]:
+    async def _get_sitemap_urls_from_robots(self, session: aiohttp.ClientSession, base: str) -> List[str]:
         urls = []
         try:
-            r = requests.get(urljoin(base, "/robots.txt"), timeout=12, headers={"User-Agent": "Mozilla/5.0"})
-            if r.ok:
-                for line in r.text.splitlines():
-                    line = line.strip()
-                    if line.lower().startswith("sitemap:"):
-                        sm = line.split(":", 1)[1].strip()
-                        if sm:
-                            urls.append(sm)
+            async with session.get(urljoin(base, "/robots.txt"), timeout=_HTTP_TIMEOUT) as r:
+                if r.ok:
+                    text = await r.text(errors="replace")
+                    for line in text.splitlines():
+                        line = line.strip()
+                        if line.lower().startswith("sitemap:"):
+                            sm = line.split(":", 1)[1].strip()
+                            if sm:
+                                urls.append(sm)
         except Exception as e:
             self._log(f"[ROBOTS-ERR] {base} -> {e}")
 
-        # 常见兜底
+        # 常见兜底：并发 HEAD 探测，只保留实际存在的 sitemap
         if not urls:
-            urls = [
+            guesses = [
                 urljoin(base, "/sitemap.xml"),
                 urljoin(base, "/sitemap_index.xml"),
                 urljoin(base, "/sitemap-index.xml"),
             ]
+            alive = await asyncio.gather(*[self._probe_sitemap(session, u) for u in guesses])
+            urls = [u for u, ok in zip(guesses, alive) if ok]
         return urls
 
-    def _parse_sitemap_recursive(self, sitemap_url: str, max_urls: int = 800) -> List[str]:
-        out, queue, seen = [], [sitemap_url], set()
-        ns = {"sm": "http://www.sitemaps.org/schemas/sitemap/0.9"}
-
-        while queue and len(out) < max_urls:
-            u = queue.pop(0)
-            if u in seen:
-                continue
-            seen.add(u)
+    async def _probe_sitemap(self, session: aiohttp.ClientSession, url: str) -> bool:
+        try:
+            async with session.head(url, allow_redirects=True, timeout=_PROBE_TIMEOUT) as r:
+                # 不支持 HEAD 的站点按存在处理，交给后续 GET 判断
+                return r.ok or r.status == 405
+        except Exception as e:
+            self._log(f"[PROBE-ERR] {url} -> {e}")
+            return False
 
+    async def _parse_sitemap_recursive(
+        self,
+        session: aiohttp.ClientSession,
+        sitemap_url: str,
+        max_urls: int = 800,
+    ) -> List[str]:
+        out, queue, seen = [], deque([sitemap_url]), set()
+        sem = asyncio.Semaphore(_SITEMAP_CONCURRENCY)
+
+        async def _fetch_one(u: str, want: int):
+            """流式抓取并解析单个 sitemap，返回 (子 sitemap 列表, 文章 URL 列表)；凑够 want 条即停止读取"""
+            children, found = [], []
             try:
-                r = requests.get(
-                    u,
-                    timeout=12,
-                    headers={"User-Agent": "Mozilla/5.0", "Accept-Encoding": "gzip, deflate"},
-                )
-                if not r.ok:
-                    self._log(f"[SITEMAP-HTTP] {u} -> {r.status_code}")
-                    continue
+                async with sem:
+                    async with session.get(
+                        u,
+                        timeout=_HTTP_TIMEOUT,
+                        # .gz 文件本身已压缩，不再让服务端套一层 Content-Encoding
+                        headers={"Accept-Encoding": "identity" if u.lower().endswith(".gz") else "gzip, deflate"},
+                    ) as r:
+                        if not r.ok:
+                            self._log(f"[SITEMAP-HTTP] {u} -> {r.status}")
+                            return children, found
+
+                        parser = ET.XMLPullParser(events=("end",))
+                        inflate = None
+                        head = b""  # 攒够前两个字节再判断是否 gzip
+                        started = False
+                        async for chunk in r.content.iter_chunked(_SITEMAP_CHUNK_SIZE):
+                            if head is not None:
+                                head += chunk
+                                if len(head) < 2:
+                                    continue
+                                chunk, head = head, None
+                                # 关键修复：支持 .gz sitemap；只认 gzip 魔数，
+                                # 服务端已按 Content-Encoding 解过压的 .gz 不会被二次解压
+                                if chunk[:2] == b"\x1f\x8b":
+                                    inflate = zlib.decompressobj(wbits=zlib.MAX_WBITS | 16)
+                            data = inflate.decompress(chunk) if inflate else chunk
+
+                            if not started:
+                                data = data.lstrip(b"\xef\xbb\xbf \t\r\n")
+                                if not data:
+                                    continue
+                                if not data.startswith(b"<"):
+                                    self._log(f"[SITEMAP-NOT-XML] {u} -> head={data[:80].decode('utf-8', 'replace')!r}")
+                                    return children, found
+                                started = True
+
+                            parser.feed(data)
+                            for _, elem in parser.read_events():
+                                tag = elem.tag.rsplit("}", 1)[-1]
+                                if tag not in ("url", "sitemap"):
+                                    continue
+                                for child in elem:
+                                    # 注释节点的 tag 不是字符串
+                                    if isinstance(child.tag, str) and child.tag.rsplit("}", 1)[-1] == "loc":
+                                        x = (child.text or "").strip()
+                                        if x:
+                                            (found if tag == "url" else children).append(x)
+                                elem.clear()
+                            if len(found) >= want:
+                                break
 
-                raw = r.content or b""
-                # 关键修复：支持 .gz sitemap
-                if u.lower().endswith(".gz") or raw[:2] == b"\x1f\x8b":
-                    raw = gzip.decompress(raw)
+            except Exception as e:
+                self._log(f"[SITEMAP-ERR] {u} -> {e}")
+            return children, found
 
-                text = raw.decode("utf-8", errors="replace").lstrip("\ufeff").strip()
-                if not text.startswith("<"):
-                    self._log(f"[SITEMAP-NOT-XML] {u} -> head={text[:80]!r}")
+        # 按层 BFS：同一层的 sitemap 并发抓取
+        while queue and len(out) < max_urls:
+            level = []
+            while queue:
+                u = queue.popleft()
+                if u in seen:
                     continue
+                seen.add(u)
+                level.append(u)
 
-                root = ET.fromstring(text)
-
-                smaps = root.findall(".//sm:sitemap/sm:loc", ns) or root.findall(".//sitemap/loc")
-                for s in smaps:
-                    loc = (s.text or "").strip()
-                    if loc:
-                        queue.append(loc)
-
-                locs = root.findall(".//sm:url/sm:loc", ns) or root.findall(".//url/loc")
-                for loc in locs:
-                    x = (loc.text or "").strip()
-                    if x:
-                        out.append(x)
-                        if len(out) >= max_urls:
-                            break
-
-            except Exception as e:
-                self._log(f"[SITEMAP-ERR] {u} -> {e}")
+            want = max_urls - len(out)
+            for children, found in await asyncio.gather(*[_fetch_one(u, want) for u in level]):
+                queue.extend(children)
+                out.extend(found[:max_urls - len(out)])
 
         return out
 
-    def _fallback_jiqizhixin_sitemap_candidates(self) -> List[Dict]:
+    async def _fallback_jiqizhixin_sitemap_candidates(self) -> List[Candidate]:
         """从机器之心的 sitemap 兜底提取候选文章链接"""
         urls = []
         base = "https://www.jiqizhixin.com"
 
-        for sitemap_url in self._get_sitemap_urls_from_robots(base):
-            sitemap_urls = self._parse_sitemap_recursive(sitemap_url, max_urls=500)
-            for url in sitemap_urls:
-                nu = self._normalize_url(base, url)  # 改这里
-                if nu and self._is_article_url(nu):
-                    urls.append({"title": "待解析标题", "url": nu})
-            if len(urls) > 0:
-                break
+        async with aiohttp.ClientSession(headers={"User-Agent": "Mozilla/5.0"}) as session:
+            for sitemap_url in await self._get_sitemap_urls_from_robots(session, base):
+                sitemap_urls = await self._parse_sitemap_recursive(session, sitemap_url, max_urls=500)
+                for url in sitemap_urls:
+                    nu = self._normalize_url(base, url)  # 改这里
+                    if nu and self._is_article_url(nu):
+                        urls.append(Candidate("待解析标题", nu))
+                if len(urls) > 0:
+                    break
 
         return urls
 
@@ -223,24 +356,33 @@ class MediaSourceCrawl4AI:
     ) -> List[Dict]:
         results = []
         seen_url = set()
-        candidates = []
-
-        for entry in entry_urls:
+        # 候选链接：加入时即按 URL 去重
+        dedup = []
+        seen_cand = set()
+
+        def _add_candidates(items: List[Candidate]):
+            for c in items:
+                if c.url in seen_cand: continue
+                seen_cand.add(c.url)
+                # URL 中的日期只解析一次，排序和详情页都复用
+                c.date = self._extract_date_from_text_or_url("", c.url)
+                c.dt = self._to_datetime(c.date) if c.date else None
+                dedup.append(c)
+
+        entry_cfg = CrawlerRunConfig(
+            cache_mode=CacheMode.BYPASS,
+            js_code=_JS_SCROLL,
+            delay_before_return_html=5.0,   # 3 -> 5
+        )
+
+        async def _open_entry(entry: str) -> List[Candidate]:
+            found = []
             self._log(f"[OPEN] {entry}")
             try:
-                config = CrawlerRunConfig(
-                    cache_mode=CacheMode.BYPASS,
-                    js_code="""
-                        window.scrollTo(0, document.body.scrollHeight);
-                        await new Promise(r => setTimeout(r, 1200));
-                        window.scrollTo(0, document.body.scrollHeight);
-                    """,
-                    delay_before_return_html=5.0,   # 3 -> 5
-                )
-                result = await crawler.arun(url=entry, config=config)
+                result = await crawler.arun(url=entry, config=entry_cfg)
                 if not result.success:
                     self._log(f"[ENTRY-ERR] {entry} -> {result.error_message}")
-                    continue
+                    return found
 
                 internal_links = result.links.get("internal", []) if result.links else []
                 for link_obj in internal_links:
@@ -255,118 +397,128 @@ class MediaSourceCrawl4AI:
                         title = "待解析标题"
                     if not self._is_article_url(href):
                         continue
-                    candidates.append({"title": title, "url": href})
+                    found.append(Candidate(title, href))
 
                 # 关键：links 太少时启用源码兜底
-                if len(candidates) < 5:
-                    candidates.extend(self._extract_urls_from_html(source, entry, result.html or ""))
+                if len(found) < 5:
+                    found.extend(self._extract_urls_from_html(source, entry, result.html or ""))
 
             except Exception as e:
                 self._log(f"[ENTRY-ERR] {entry} -> {e}")
+            return found
 
-        # 机器之心：入口抓不到时，走 robots+sitemap
-        if source == "jiqizhixin" and len(candidates) == 0:
-            candidates.extend(self._fallback_jiqizhixin_sitemap_candidates())
+        # 1. 并发打开各入口页，按入口顺序合并候选
+        for found in await asyncio.gather(*[_open_entry(e) for e in entry_urls]):
+            _add_candidates(found)
 
-        # 去重候选链接
-        dedup = []
-        seen = set()
-        for c in candidates:
-            if c["url"] in seen: continue
-            seen.add(c["url"])
-            dedup.append(c)
+        # 机器之心：入口抓不到时，走 robots+sitemap
+        if source == "jiqizhixin" and len(dedup) == 0:
+            _add_candidates(await self._fallback_jiqizhixin_sitemap_candidates())
 
         self._log(f"[{source}] candidates={len(dedup)}")
 
         # 仅修复：限制候选探测数量，避免 jiqizhixin 候选过多导致抓取过慢
-        def _rank_candidate(item: Dict):
-            d = self._extract_date_from_text_or_url("", item.get("url", ""))
-            dt = self._to_datetime(d) if d else None
-            # 优先：有日期 > 无日期；日期越新越靠前
-            return (1 if dt else 0, dt or datetime.min)
-
-        dedup = sorted(dedup, key=_rank_candidate, reverse=True)
-        max_probe = max(limit, 10) if source == "jiqizhixin" else max(limit, 10)
-        dedup = dedup[:max_probe]
+        # 优先：有日期 > 无日期；日期越新越靠前（同日期保持原顺序）
+        max_probe = max(limit, 10)
+        with_date = [c for c in dedup if c.dt]
+        without_date = [c for c in dedup if not c.dt]
+        with_date.sort(key=lambda c: c.dt, reverse=True)
+        dedup = (with_date + without_date)[:max_probe]
         self._log(f"[{source}] probe={len(dedup)}")
 
-        # 2. 抓取文章详情页
+        # 2. 抓取文章详情页：并发抓取，仍按排序顺序处理结果
+        sem = asyncio.Semaphore(_ARTICLE_CONCURRENCY)
+        art_cfg = CrawlerRunConfig(cache_mode=CacheMode.BYPASS)
+
+        async def _fetch_article(url: str):
+            async with sem:
+                return await crawler.arun(url=url, config=art_cfg)
+
+        todo = []
         for c in dedup:
-            if c["url"] in seen_url: continue
-            seen_url.add(c["url"])
+            if c.url in seen_url: continue
+            seen_url.add(c.url)
+            todo.append(c)
+        tasks = [asyncio.create_task(_fetch_article(c.url)) for c in todo]
 
-            try:
-                config = CrawlerRunConfig(cache_mode=CacheMode.BYPASS)
-                res = await crawler.arun(url=c["url"], config=config)
+        try:
+            for c, task in zip(todo, tasks):
+                try:
+                    res = await task
                 
-                if not res.success:
-                    continue
+                    if not res.success:
+                        continue
 
-                # crawl4ai 自动提取了干净的 Markdown
-                markdown_text = res.markdown or ""
-                html_text = res.html or ""
+                    # crawl4ai 自动提取了干净的 Markdown
+                    markdown_text = res.markdown or ""
+                    html_text = res.html or ""
                 
-                # 提取日期
-                pub_date = self._extract_date_from_text_or_url(markdown_text, c["url"])
-                if not pub_date:
-                    # 兜底：从 HTML meta 中正则提取
-                    m = re.search(r'content="([^"]*202\d[-/]\d{1,2}[-/]\d{1,2}[^"]*)"', html_text)
-                    if m:
-                        pub_date = self._extract_date_from_text_or_url(m.group(1), "")
-
-                dt = self._to_datetime(pub_date)
-
-                # 按指定日期过滤（用于每日推送：昨天 00:00-23:59）
-                if target_date is not None:
-                    if dt is None or dt.date() != target_date:
-                        continue
-                else:
-                    # 原有逻辑
-                    if dt is None:
-                        if source != "jiqizhixin":
+                    # 提取日期
+                    pub_date = self._extract_date_from_text_or_url(markdown_text, "") or c.date
+                    if not pub_date:
+                        # 兜底：从 HTML meta 中正则提取
+                        m = _RE_META_DATE.search(html_text)
+                        if m:
+                            pub_date = self._extract_date_from_text_or_url(m.group(1), "")
+
+                    dt = self._to_datetime(pub_date)
+
+                    # 按指定日期过滤（用于每日推送：昨天 00:00-23:59）
+                    if target_date is not None:
+                        if dt is None or dt.date() != target_date:
+                            continue
+                    else:
+                        # 原有逻辑
+                        if dt is None:
+                            if source != "jiqizhixin":
+                                continue
+                        elif not self._is_recent(dt, days):
                             continue
-                    elif not self._is_recent(dt, days):
-                        continue
 
-                # 修正标题（如果抓取到的标题太短，用详情页的标题）
-                final_title = c["title"]
-                if res.metadata and res.metadata.get("title"):
-                    page_title = self._clean(res.metadata.get("title").split("|")[0].split("-")[0])
-                    if len(page_title) > len(final_title) or final_title == "待解析标题":
-                        final_title = page_title
-
-                # 机器之心兜底页/栏目页过滤（关键）
-                if source == "jiqizhixin":
-                    bad_title_kw = ["文章库", "找不到您请求的页面", "404"]
-                    if any(k in final_title for k in bad_title_kw):
+                    # 修正标题（如果抓取到的标题太短，用详情页的标题）
+                    final_title = c.title
+                    if res.metadata and res.metadata.get("title"):
+                        page_title = self._clean(res.metadata.get("title").split("|")[0].split("-")[0])
+                        if len(page_title) > len(final_title) or final_title == "待解析标题":
+                            final_title = page_title
+
+                    # 机器之心兜底页/栏目页过滤（关键）
+                    if source == "jiqizhixin":
+                        bad_title_kw = ["文章库", "找不到您请求的页面", "404"]
+                        if any(k in final_title for k in bad_title_kw):
+                            continue
+                        # 正文太短也跳过（防止落到空模板页）
+                        if len(self._clean(markdown_text)) < 200:
+                            continue
+
+                    # 如果还是没拿到有效标题，丢弃
+                    if final_title == "待解析标题" or len(final_title) < 4:
                         continue
-                    # 正文太短也跳过（防止落到空模板页）
-                    if len(self._clean(markdown_text)) < 200:
+                    if "找不到您请求的页面" in final_title or "404" in final_title.lower():
                         continue
 
-                # 如果还是没拿到有效标题，丢弃
-                if final_title == "待解析标题" or len(final_title) < 4:
-                    continue
-                if "找不到您请求的页面" in final_title or "404" in final_title.lower():
-                    continue
-
-                results.append({
-                    "title": final_title,
-                    "url": c["url"],
-                    "abstract": self._clean(markdown_text[:800]), # 直接用干净的 Markdown 做摘要
-                    "source": source,
-                    "source_type": "commentary",
-                    "is_secondary": True,
-                    "paper_ref_confidence": 0.35,
-                    "pub_date": pub_date or "",
-                })
-
-                self._log(f"[KEEP] [{source}] {final_title[:28]}... {pub_date or 'N/A'}")
-                if len(results) >= limit:
-                    break
-
-            except Exception as e:
-                self._log(f"[ARTICLE-ERR] {c['url']} -> {e}")
+                    results.append({
+                        "title": final_title,
+                        "url": c.url,
+                        "abstract": self._clean(markdown_text[:800]), # 直接用干净的 Markdown 做摘要
+                        "source": source,
+                        "source_type": "commentary",
+                        "is_secondary": True,
+                        "paper_ref_confidence": 0.35,
+                        "pub_date": pub_date or "",
+                    })
+
+                    self._log(f"[KEEP] [{source}] {final_title[:28]}... {pub_date or 'N/A'}")
+                    if len(results) >= limit:
+                        break
+
+                except Exception as e:
+                    self._log(f"[ARTICLE-ERR] {c.url} -> {e}")
+        finally:
+            # 已凑够 limit 或本协程被取消/出错：取消尚未完成的请求，不留无主任务占用浏览器
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
 
         return results
 